@@ -9,11 +9,13 @@ Requirements:
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import struct
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -25,8 +27,9 @@ def run(cmd: list[str]) -> None:
     subprocess.run(cmd, check=True)
 
 
-def render_png(svg_path: Path, size: int, output_path: Path) -> None:
-    run(
+def render_png(svg_path: Path, size: int, output_path: Path) -> bytes:
+    # Capture the PNG from stdout so later steps can reuse it without re-reading.
+    data = subprocess.run(
         [
             "rsvg-convert",
             "-w",
@@ -34,29 +37,29 @@ def render_png(svg_path: Path, size: int, output_path: Path) -> None:
             "-h",
             str(size),
             str(svg_path),
-            "-o",
-            str(output_path),
-        ]
-    )
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    output_path.write_bytes(data)
+    return data
 
 
-def png_dimensions(png_path: Path) -> tuple[int, int]:
-    data = png_path.read_bytes()
+def png_dimensions(data: bytes, png_path: Path) -> tuple[int, int]:
     if len(data) < 24 or data[:8] != b"\x89PNG\r\n\x1a\n":
         raise ValueError(f"{png_path} is not a valid PNG")
     width, height = struct.unpack(">II", data[16:24])
     return width, height
 
 
-def build_ico(png_paths: list[Path], ico_path: Path) -> None:
-    image_payloads = [p.read_bytes() for p in png_paths]
+def build_ico(png_payloads: dict[Path, bytes], ico_path: Path) -> None:
+    image_payloads = list(png_payloads.values())
 
     entries = bytearray()
     offset = 6 + (16 * len(image_payloads))
-    payload_blob = bytearray()
 
-    for payload, png_path in zip(image_payloads, png_paths):
-        width, height = png_dimensions(png_path)
+    for png_path, payload in png_payloads.items():
+        width, height = png_dimensions(payload, png_path)
         if width != height:
             raise ValueError(f"{png_path} is not square ({width}x{height})")
         if width > 256 or height > 256:
@@ -78,14 +81,17 @@ def build_ico(png_paths: list[Path], ico_path: Path) -> None:
                 offset,
             )
         )
-        payload_blob.extend(payload)
         offset += len(payload)
 
     header = struct.pack("<HHH", 0, 1, len(image_payloads))
-    ico_path.write_bytes(header + entries + payload_blob)
+    with ico_path.open("wb") as f:
+        f.write(header)
+        f.write(entries)
+        for payload in image_payloads:
+            f.write(payload)
 
 
-def generate_icns(output_path: Path, size_to_png: dict[int, Path]) -> bool:
+def generate_icns(output_path: Path, size_to_payload: dict[int, bytes]) -> bool:
     if shutil.which("iconutil") is None:
         return False
 
@@ -107,7 +113,7 @@ def generate_icns(output_path: Path, size_to_png: dict[int, Path]) -> bool:
         }
 
         for filename, size in mapping.items():
-            shutil.copy2(size_to_png[size], iconset / filename)
+            (iconset / filename).write_bytes(size_to_payload[size])
 
         run(
             [
@@ -162,17 +168,21 @@ def main() -> int:
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    size_to_png: dict[int, Path] = {}
-    for size in PNG_SIZES:
-        png_path = out_dir / f"{basename}-{size}.png"
-        render_png(svg_path, size, png_path)
-        size_to_png[size] = png_path
+    size_to_png = {size: out_dir / f"{basename}-{size}.png" for size in PNG_SIZES}
+    # Each rsvg-convert run is an independent process, so render all sizes
+    # concurrently; threads suffice since they only wait on subprocesses.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {
+            size: pool.submit(render_png, svg_path, size, png_path)
+            for size, png_path in size_to_png.items()
+        }
+        size_to_payload = {size: future.result() for size, future in futures.items()}
 
-    ico_sources = [size_to_png[size] for size in ICO_SIZES]
+    ico_sources = {size_to_png[size]: size_to_payload[size] for size in ICO_SIZES}
     build_ico(ico_sources, out_dir / f"{basename}.ico")
 
     icns_path = out_dir / f"{basename}.icns"
-    icns_generated = generate_icns(icns_path, size_to_png)
+    icns_generated = generate_icns(icns_path, size_to_payload)
 
     print(f"Generated PNG sizes: {', '.join(str(s) for s in PNG_SIZES)}")
     print(f"Generated Windows ICO: {out_dir / f'{basename}.ico'}")
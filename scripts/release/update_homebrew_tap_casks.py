@@ -5,13 +5,17 @@ Semantics:
 - Stable cask points at latest stable release tag vX.Y.Z.
 - Beta cask points at beta-track target = max(latest stable, latest beta).
 - Beta cask always uses beta-branded artifacts (ButterPaper-Beta-vX.Y.Z-*).
+- The GitHub releases response is cached in
+  ${XDG_CACHE_HOME:-~/.cache}/butterpaper-homebrew-sync and revalidated via ETag.
 """
 
 from __future__ import annotations
 
 import argparse
 import dataclasses
+import hashlib
 import json
+import os
 import re
 import sys
 import urllib.error
@@ -65,18 +69,57 @@ def semver_key(s: SemVer) -> tuple[int, int, int, int, int]:
     return (s.major, s.minor, s.patch, is_stable, prerelease_num)
 
 
+def releases_cache_path() -> Path:
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_root) / "butterpaper-homebrew-sync" / "releases.json"
+
+
+def load_cached_releases(path: Path) -> tuple[str, list] | None:
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    etag = cached.get("etag")
+    payload = cached.get("payload")
+    if not isinstance(etag, str) or not isinstance(payload, list):
+        return None
+    return etag, payload
+
+
+def store_cached_releases(path: Path, etag: str, payload: list) -> None:
+    # Best effort: a missing cache only costs a full fetch next time.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"etag": etag, "payload": payload}), encoding="utf-8")
+    except OSError:
+        pass
+
+
 def fetch_releases() -> list[Release]:
-    req = urllib.request.Request(
-        RELEASES_URL,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "butterpaper-homebrew-sync",
-        },
-    )
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "butterpaper-homebrew-sync",
+    }
+    cache_path = releases_cache_path()
+    cached = load_cached_releases(cache_path)
+    if cached:
+        # GitHub answers 304 with no body when the release list is unchanged.
+        headers["If-None-Match"] = cached[0]
+
+    req = urllib.request.Request(RELEASES_URL, headers=headers)
 
     try:
         with urllib.request.urlopen(req, timeout=20) as resp:
             payload = json.loads(resp.read().decode("utf-8"))
+            etag = resp.headers.get("ETag")
+        if etag:
+            store_cached_releases(cache_path, etag, payload)
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or not cached:
+            raise RuntimeError(f"Failed to fetch releases: {exc}") from exc
+        payload = cached[1]
     except urllib.error.URLError as exc:
         raise RuntimeError(f"Failed to fetch releases: {exc}") from exc
 
@@ -177,11 +220,22 @@ end
 '''
 
 
+def file_digest(path: Path) -> bytes | None:
+    if not path.exists():
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(64 * 1024), b""):
+            digest.update(block)
+    return digest.digest()
+
+
 def write_if_changed(path: Path, content: str) -> bool:
-    current = path.read_text() if path.exists() else None
-    if current == content:
+    data = content.encode("utf-8")
+    # Compare digests so the existing file is streamed rather than held in memory.
+    if file_digest(path) == hashlib.blake2b(data, digest_size=16).digest():
         return False
-    path.write_text(content)
+    path.write_bytes(data)
     return True
 
 
@@ -20,6 +20,13 @@ import re
 import sys
 from pathlib import Path
 
+# Match: ## [0.0.2] - 2026-02-10 (including the line break after it).
+SECTION_HEADER_RE = re.compile(
+    r"^## \[(?P<version>[^\]]+)\][ \t]*-[ \t]*\d{4}-\d{2}-\d{2}[ \t]*$\n?",
+    re.MULTILINE,
+)
+NEXT_SECTION_RE = re.compile(r"^## ", re.MULTILINE)
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
@@ -42,33 +49,18 @@ def main() -> int:
     changelog_path = Path(args.changelog)
     text = changelog_path.read_text(encoding="utf-8")
 
-    # Match: ## [0.0.2] - 2026-02-10
-    header_re = re.compile(
-        r"^## \[" + re.escape(version) + r"\]\s*-\s*\d{4}-\d{2}-\d{2}\s*$"
+    header = next(
+        (m for m in SECTION_HEADER_RE.finditer(text) if m.group("version") == version),
+        None,
     )
-    lines = text.splitlines()
-
-    start = None
-    for i, line in enumerate(lines):
-        if header_re.match(line):
-            start = i
-            break
-
-    if start is None:
+    if header is None:
         sys.stderr.write(f"error: missing changelog entry for {version} in {changelog_path}\n")
         return 2
 
-    end = len(lines)
-    for j in range(start + 1, len(lines)):
-        if lines[j].startswith("## "):
-            end = j
-            break
-
-    section = "\n".join(lines[start:end]).strip() + "\n"
-
-    # Strip the top-level header line; GH release already has tag/title.
-    section_lines = section.splitlines()
-    body = "\n".join(section_lines[1:]).lstrip("\n").rstrip() + "\n"
+    # The header line itself is dropped; GH release already has tag/title.
+    next_section = NEXT_SECTION_RE.search(text, header.end())
+    end = next_section.start() if next_section else len(text)
+    body = text[header.end() : end].lstrip("\n").rstrip() + "\n"
     sys.stdout.write(body)
     return 0
 
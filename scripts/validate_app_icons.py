@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import struct
 import sys
 import zlib
@@ -44,16 +45,9 @@ def parse_ico_sizes(path: Path) -> list[int]:
     return sizes
 
 
-def paeth_predictor(a: int, b: int, c: int) -> int:
-    p = a + b - c
-    pa = abs(p - a)
-    pb = abs(p - b)
-    pc = abs(p - c)
-    if pa <= pb and pa <= pc:
-        return a
-    if pb <= pc:
-        return b
-    return c
+def add_bytes_mod256(x: int, y: int, low: int, high: int) -> int:
+    """Byte-wise (x + y) & 0xFF over packed rows, without carries crossing bytes."""
+    return ((x & low) + (y & low)) ^ ((x ^ y) & high)
 
 
 def decode_png_rgba_alpha_bounds(path: Path) -> tuple[int, int, float, float]:
@@ -64,14 +58,18 @@ def decode_png_rgba_alpha_bounds(path: Path) -> tuple[int, int, float, float]:
     cursor = 8
     width = height = None
     bit_depth = color_type = None
-    idat_chunks: list[bytes] = []
+    # Inflate IDAT chunks as they are found, read through a memoryview, so the
+    # compressed stream is never sliced out or joined into a second copy.
+    view = memoryview(data)
+    decompressor = zlib.decompressobj()
+    payload = bytearray()
 
     while cursor + 8 <= len(data):
         length = struct.unpack_from(">I", data, cursor)[0]
         cursor += 4
         chunk_type = data[cursor : cursor + 4]
         cursor += 4
-        chunk_data = data[cursor : cursor + length]
+        chunk_data = view[cursor : cursor + length]
         cursor += length
         cursor += 4  # CRC
 
@@ -82,7 +80,7 @@ def decode_png_rgba_alpha_bounds(path: Path) -> tuple[int, int, float, float]:
             if comp != 0 or filt != 0 or interlace != 0:
                 fail(f"Unsupported PNG encoding options in {path}")
         elif chunk_type == b"IDAT":
-            idat_chunks.append(chunk_data)
+            payload += decompressor.decompress(chunk_data)
         elif chunk_type == b"IEND":
             break
 
@@ -96,17 +94,42 @@ def decode_png_rgba_alpha_bounds(path: Path) -> tuple[int, int, float, float]:
     if channels is None:
         fail(f"Unsupported PNG color type ({color_type}) in {path}")
 
-    payload = zlib.decompress(b"".join(idat_chunks))
+    payload += decompressor.flush()
     bytes_per_pixel = channels
     row_bytes = width * bytes_per_pixel
     expected = (row_bytes + 1) * height
     if len(payload) != expected:
         fail(f"Unexpected decompressed PNG size in {path}")
 
-    rows: list[bytes] = []
+    filter_types = payload[:: row_bytes + 1]
+    unsupported = filter_types.translate(None, bytes(range(5)))
+    if unsupported:
+        fail(f"Unsupported PNG filter type ({unsupported[0]}) in {path}")
+
+    if color_type in (0, 2):
+        # No alpha channel: every pixel is opaque, so the rows never need
+        # reconstructing to know the image covers the full frame.
+        return width, height, 1.0, 1.0
+
+    # Sub and Up filters are plain byte-wise additions, so they are applied to a
+    # whole row at once by packing it into an int (SWAR) instead of per byte.
+    low = int.from_bytes(b"\x7f" * row_bytes, "little")
+    high = int.from_bytes(b"\x80" * row_bytes, "little")
+    full = (1 << (8 * row_bytes)) - 1
+
+    min_x = width
+    min_y = height
+    max_x = -1
+    max_y = -1
+
+    alpha_offset = channels - 1
+    transparent_lane = bytes(width)
+
+    # Only the previous row is kept: each row updates the bounds as soon as it
+    # is reconstructed instead of holding the whole image in memory.
     prev_row = bytes(row_bytes)
     pos = 0
-    for _ in range(height):
+    for y in range(height):
         filt = payload[pos]
         pos += 1
         raw = payload[pos : pos + row_bytes]
@@ -116,47 +139,62 @@ def decode_png_rgba_alpha_bounds(path: Path) -> tuple[int, int, float, float]:
         if filt == 0:
             recon[:] = raw
         elif filt == 1:
-            for i in range(row_bytes):
-                left = recon[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
-                recon[i] = (raw[i] + left) & 0xFF
+            # Prefix sum over each byte lane in log2(width) shifted additions.
+            acc = int.from_bytes(raw, "little")
+            shift = bytes_per_pixel
+            while shift < row_bytes:
+                acc = add_bytes_mod256(acc, (acc << (8 * shift)) & full, low, high)
+                shift *= 2
+            recon[:] = acc.to_bytes(row_bytes, "little")
         elif filt == 2:
-            for i in range(row_bytes):
-                recon[i] = (raw[i] + prev_row[i]) & 0xFF
+            acc = add_bytes_mod256(
+                int.from_bytes(raw, "little"), int.from_bytes(prev_row, "little"), low, high
+            )
+            recon[:] = acc.to_bytes(row_bytes, "little")
         elif filt == 3:
             for i in range(row_bytes):
                 left = recon[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
                 up = prev_row[i]
                 recon[i] = (raw[i] + ((left + up) // 2)) & 0xFF
-        elif filt == 4:
-            for i in range(row_bytes):
-                left = recon[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+        else:  # filt == 4
+            # The first pixel has no left/up-left neighbours, so Paeth reduces
+            # to Up there; the rest inline the predictor, with p - a, p - b and
+            # p - c expanded so no call or bounds check happens per byte.
+            for i in range(bytes_per_pixel):
+                recon[i] = (raw[i] + prev_row[i]) & 0xFF
+            for i in range(bytes_per_pixel, row_bytes):
+                left = recon[i - bytes_per_pixel]
                 up = prev_row[i]
-                up_left = prev_row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
-                recon[i] = (raw[i] + paeth_predictor(left, up, up_left)) & 0xFF
-        else:
-            fail(f"Unsupported PNG filter type ({filt}) in {path}")
+                up_left = prev_row[i - bytes_per_pixel]
+                pa = abs(up - up_left)
+                pb = abs(left - up_left)
+                pc = abs(left + up - up_left - up_left)
+                if pa <= pb and pa <= pc:
+                    recon[i] = (raw[i] + left) & 0xFF
+                elif pb <= pc:
+                    recon[i] = (raw[i] + up) & 0xFF
+                else:
+                    recon[i] = (raw[i] + up_left) & 0xFF
 
-        rows.append(bytes(recon))
         prev_row = bytes(recon)
 
-    min_x = width
-    min_y = height
-    max_x = -1
-    max_y = -1
-
-    for y, row in enumerate(rows):
-        for x in range(width):
-            if color_type in (0, 2):
-                alpha = 255
-            elif color_type == 4:
-                alpha = row[(x * 2) + 1]
-            else:  # color_type == 6
-                alpha = row[(x * 4) + 3]
-            if alpha > 0:
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
+        alpha = prev_row[alpha_offset::channels]
+        if min_x == 0 and max_x == width - 1:
+            # The bounds already span the full width; only max_y can still grow.
+            if alpha != transparent_lane:
+                max_y = y
+            continue
+
+        # Let bytes.lstrip/rstrip find the first and last non-transparent pixel
+        # at C speed instead of testing each pixel.
+        first = width - len(alpha.lstrip(b"\x00"))
+        if first == width:
+            continue
+        last = len(alpha.rstrip(b"\x00")) - 1
+        min_x = min(min_x, first)
+        max_x = max(max_x, last)
+        min_y = min(min_y, y)
+        max_y = y
 
     if max_x < min_x or max_y < min_y:
         fail(f"PNG appears fully transparent: {path}")
@@ -191,7 +229,13 @@ def main() -> int:
     required_files = [icons_dir / "butterpaper-icon.ico", icons_dir / "butterpaper-icon.icns"]
     required_files += [icons_dir / f"butterpaper-icon-{size}.png" for size in EXPECTED_PNG_SIZES]
 
-    missing = [path for path in required_files if not path.exists()]
+    # List the directory once instead of stat-ing each required file.
+    try:
+        with os.scandir(icons_dir) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
+    missing = [path for path in required_files if path.name not in present]
     if missing:
         fail("Missing icon assets:\n" + "\n".join(str(path) for path in missing))
 